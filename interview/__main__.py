@@ -7,4 +7,4 @@ def generate_input():
         yield json.loads(line)
 
 for output in weather.process_events(generate_input()):
-    print(json.dumps(output))
+    print(output)
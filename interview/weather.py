@@ -1,6 +1,22 @@
 import json
+from itertools import groupby, islice
 from typing import Any, Iterable, Generator
 
+# Upper bound on _Station records kept for reuse after a reset
+_FREE_LIST_SIZE = 1024
+
+# Context prepended to every validation error raised while processing events
+_ERROR_PREFIX = "Error processing event: "
+
+class _Station:  # pylint: disable=too-few-public-methods
+    """High/low temperature record for a single weather station."""
+
+    __slots__ = ('high', 'low')
+
+    def __init__(self, temperature: float):
+        self.high = temperature
+        self.low = temperature
+
 class WeatherProcessor:
     """
     A class to process and manage weather station data.
@@ -9,6 +25,11 @@ class WeatherProcessor:
     including high and low temperatures for each station. It provides methods to
     process new temperature samples, generate snapshots of the current state,
     and reset the data.
+
+    Station records in `stations` are owned by the processor and recycled
+    after a reset, so a record held from before a reset may later hold
+    another station's data. Read values through `stations` or a snapshot
+    rather than keeping records across resets.
     """
     
     def __init__(self):
@@ -16,10 +37,50 @@ class WeatherProcessor:
         Initialize a new WeatherProcessor instance.
         
         Creates an empty dictionary to store station data and initializes
-        the last timestamp to 0.
+        the last timestamp to 0 and the all-station bounds to infinity.
         """
         self.stations = {} 
         self.last_timestamp = 0
+        self._global_high = float('-inf')
+        self._global_low = float('inf')
+        # Last snapshot generated and its asOf, reused until a station
+        # bound changes or the latest timestamp moves
+        self._snapshot: str | None = None
+        self._snapshot_as_of = 0
+        # Station records released by reset, reused for new stations
+        self._free: list[_Station] = []
+
+    def _add_station(self, station_name: Any, temperature: float) -> None:
+        """Record the first reading for a station not yet in the table."""
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(station_name) is not str or not station_name:
+            raise ValueError(_ERROR_PREFIX + "Station name must be a non-empty string")
+        if self._free:
+            station = self._free.pop()
+            station.high = temperature
+            station.low = temperature
+        else:
+            station = _Station(temperature)
+        self.stations[station_name] = station
+        self._snapshot = None
+        if temperature > self._global_high:
+            self._global_high = temperature
+        if temperature < self._global_low:
+            self._global_low = temperature
+
+    def _extend_high(self, station: _Station, temperature: float) -> None:
+        """Record a reading above a station's current high."""
+        station.high = temperature
+        self._snapshot = None
+        if temperature > self._global_high:
+            self._global_high = temperature
+
+    def _extend_low(self, station: _Station, temperature: float) -> None:
+        """Record a reading below a station's current low."""
+        station.low = temperature
+        self._snapshot = None
+        if temperature < self._global_low:
+            self._global_low = temperature
 
     def process_sample(self, sample: dict[str, Any]) -> None:
         """
@@ -32,79 +93,183 @@ class WeatherProcessor:
                 - timestamp (int): Time of the reading
         
         Raises:
-            ValueError: If station name is empty or temperature is not a number
+            ValueError: If station name is not a non-empty string, temperature
+                is not a number or timestamp is not an integer
         """
-        station_name = sample['stationName']
-        temperature = sample['temperature']
-        timestamp = sample['timestamp']
-        
-        # Check if station name is empty
-        if not station_name:
-            raise ValueError("Station name cannot be empty")
-        
-        # Check if temperature is a valid number
-        if not isinstance(temperature, (int, float)):
-            raise ValueError("Temperature must be a number")
-        
-        # Update last timestamp
-        self.last_timestamp = max(self.last_timestamp, timestamp)
-        
-        # If station doesn't exist, create new record
-        if station_name not in self.stations:
-            self.stations[station_name] = {
-                'high': temperature,
-                'low': temperature,
-                'last_timestamp': timestamp
-            }
-        else:
-            # Update existing station data
-            station = self.stations[station_name]
-            station['high'] = max(station['high'], temperature)
-            station['low'] = min(station['low'], temperature)
-            station['last_timestamp'] = timestamp
+        # Missing fields come back as None, which fails the checks below
+        station_name = sample.get('stationName')
+        temperature = sample.get('temperature')
+        timestamp = sample.get('timestamp')
+
+        # Exact type checks are cheaper than isinstance and reject bools
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(temperature) is not float and type(temperature) is not int:
+            raise ValueError(_ERROR_PREFIX + "Temperature must be a number")
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(timestamp) is not int:
+            raise ValueError(_ERROR_PREFIX + "Timestamp must be an integer")
+
+        # Only names not yet in the table need checking, which keeps the
+        # common case of updating a known station free of that check. A
+        # reading can extend at most one bound since low <= high.
+        try:
+            station = self.stations.get(station_name)
+        except TypeError:
+            # Unhashable names such as lists can never be valid
+            raise ValueError(
+                _ERROR_PREFIX + "Station name must be a non-empty string"
+            ) from None
+        if station is None:
+            self._add_station(station_name, temperature)
+        elif temperature > station.high:
+            self._extend_high(station, temperature)
+        elif temperature < station.low:
+            self._extend_low(station, temperature)
+
+        if timestamp > self.last_timestamp:
+            self.last_timestamp = timestamp
+
+    def process_batch(self, samples: Iterable[dict[str, Any]]) -> None:
+        """
+        Process a batch of weather samples.
+
+        Equivalent to calling process_sample on each sample in turn, but
+        keeps the station lookup and latest timestamp in local variables
+        for the duration of the batch. Intended for bulk replay, where
+        the per-sample method call and attribute lookups dominate.
+
+        Args:
+            samples (Iterable[dict]): Sample dictionaries in the format
+                accepted by process_sample
+
+        Raises:
+            ValueError: If station name is not a non-empty string, temperature
+                is not a number or timestamp is not an integer
+        """
+        # Same checks and updates as process_sample, kept inline so the loop
+        # makes no call per sample; rare branches share the helpers above
+        get_station = self.stations.get
+        last_timestamp = self.last_timestamp
+        try:
+            for sample in samples:
+                station_name = sample.get('stationName')
+                temperature = sample.get('temperature')
+                timestamp = sample.get('timestamp')
+
+                # pylint: disable-next=unidiomatic-typecheck
+                if type(temperature) is not float and type(temperature) is not int:
+                    raise ValueError(_ERROR_PREFIX + "Temperature must be a number")
+                # pylint: disable-next=unidiomatic-typecheck
+                if type(timestamp) is not int:
+                    raise ValueError(_ERROR_PREFIX + "Timestamp must be an integer")
+
+                try:
+                    station = get_station(station_name)
+                except TypeError:
+                    raise ValueError(
+                        _ERROR_PREFIX + "Station name must be a non-empty string"
+                    ) from None
+                if station is None:
+                    self._add_station(station_name, temperature)
+                elif temperature > station.high:
+                    self._extend_high(station, temperature)
+                elif temperature < station.low:
+                    self._extend_low(station, temperature)
+
+                if timestamp > last_timestamp:
+                    last_timestamp = timestamp
+        finally:
+            # Samples before a failing one have been applied, as they
+            # would have been by process_sample
+            self.last_timestamp = last_timestamp
 
     def get_snapshot(self) -> str:
         """
         Generate a snapshot of the current weather data.
         
+        Back-to-back snapshots with no change in between return the
+        previously generated string.
+        
         Returns:
             str: A JSON string containing:
                 - type (str): Always "snapshot"
                 - asOf (int): Timestamp of the latest data
                 - stations (dict): Dictionary of station data with high/low temperatures
         """
+        if self._snapshot is not None and self._snapshot_as_of == self.last_timestamp:
+            return self._snapshot
+
         data = {
             "type": "snapshot",
             "asOf": self.last_timestamp,
             "stations": {
-                name: {"high": data['high'], "low": data['low']}
-                for name, data in self.stations.items()
+                name: {"high": station.high, "low": station.low}
+                for name, station in self.stations.items()
             }
         }
-        return json.dumps(data)
+        self._snapshot = json.dumps(data)
+        self._snapshot_as_of = self.last_timestamp
+        return self._snapshot
+
+    def get_global(self) -> tuple[float, float] | None:
+        """
+        Get the high and low temperatures across all stations.
+
+        Maintained as samples arrive, so this does not iterate the stations.
+
+        Returns:
+            tuple: (high, low) over every station, or None if there is no
+                sample data
+        """
+        if not self.stations:
+            return None
+        return self._global_high, self._global_low
 
     def reset(self) -> str:
         """
         Reset all weather data and return a reset confirmation.
-        
+
+        Up to _FREE_LIST_SIZE of the dropped station records are kept and
+        reused for stations added afterwards.
+
         Returns:
             str: A JSON string containing:
                 - type (str): Always "reset"
                 - asOf (int): Timestamp when the reset occurred
         """
         reset_timestamp = self.last_timestamp
+        # Keep some records for reuse so periodic resets don't churn the allocator
+        room = _FREE_LIST_SIZE - len(self._free)
+        if room > 0:
+            self._free.extend(islice(self.stations.values(), room))
         self.stations.clear()
         self.last_timestamp = 0
+        self._global_high = float('-inf')
+        self._global_low = float('inf')
+        self._snapshot = None
         data = {
             "type": "reset",
             "asOf": reset_timestamp
         }
         return json.dumps(data)
 
+def _event_type(event: dict[str, Any]) -> Any:
+    """Return the type of an event, used to group runs of events."""
+    if not isinstance(event, dict):
+        raise ValueError(_ERROR_PREFIX + "Event must be an object")
+    try:
+        return event['type']
+    except KeyError:
+        raise ValueError(_ERROR_PREFIX + "Event must have a type") from None
+
 def process_events(events: Iterable[dict[str, Any]]) -> Generator[str, None, None]:
     """
     Process a stream of weather events and control commands.
     
+    Consecutive sample events are folded into the processor as one lazy
+    batch, so the loop here only steps once per run of samples and once
+    per control event.
+    
     Args:
         events (Iterable[dict]): An iterable of event dictionaries. Each event can be:
             - A sample event with weather data
@@ -117,34 +282,57 @@ def process_events(events: Iterable[dict[str, Any]]) -> Generator[str, None, Non
         ValueError: If an event is invalid or processing fails
     """
     processor = WeatherProcessor()
+    # Bind the per-run calls once rather than looking them up each iteration
+    process_batch = processor.process_batch
+    get_snapshot = processor.get_snapshot
+    reset = processor.reset
     
-    for event in events:
-        try:
-            event_type = event.get('type')
-            if event_type is None:
-                raise ValueError("Event must have a type")
-            
-            if event_type == 'sample':
-                processor.process_sample(event)
-            elif event_type == 'control':
-                # Only process control messages if we have sample data
-                if not processor.stations:
-                    continue
-                    
-                command = event.get('command')
-                if command is None:
-                    raise ValueError("Control message must have a command")
-                    
-                if command == 'snapshot':
-                    yield processor.get_snapshot()
-                elif command == 'reset':
-                    yield processor.reset()
-                else:
-                    raise ValueError("Unknown command")
-            else:
-                raise ValueError("Please verify input")
-                
-        except ValueError as e:
-            raise ValueError(f"Error processing event: {str(e)}")
-        except Exception as e:
-            raise ValueError(f"Error processing event: {str(e)}")
\ No newline at end of file
+    for event_type, group in groupby(events, key=_event_type):
+        match event_type:
+            case 'sample':
+                process_batch(group)
+            case 'control':
+                for event in group:
+                    # Only process control messages if we have sample data
+                    if not processor.stations:
+                        continue
+
+                    try:
+                        command = event['command']
+                    except KeyError:
+                        raise ValueError(
+                            _ERROR_PREFIX + "Control message must have a command"
+                        ) from None
+
+                    match command:
+                        case 'snapshot':
+                            yield get_snapshot()
+                        case 'reset':
+                            yield reset()
+                        case None:
+                            raise ValueError(_ERROR_PREFIX + "Control message must have a command")
+                        case _:
+                            raise ValueError(_ERROR_PREFIX + "Unknown command")
+            case None:
+                raise ValueError(_ERROR_PREFIX + "Event must have a type")
+            case _:
+                raise ValueError(_ERROR_PREFIX + "Please verify input")
+
+def run(events: Iterable[dict[str, Any]]) -> list[str]:
+    """
+    Process a stream of weather events and return all outputs at once.
+    
+    A convenience for batch consumers that would otherwise materialize
+    process_events themselves. The outputs are the same, in order.
+    
+    Args:
+        events (Iterable[dict]): An iterable of event dictionaries, as
+            accepted by process_events
+    
+    Returns:
+        list: JSON strings for control commands (snapshots and reset confirmations)
+    
+    Raises:
+        ValueError: If an event is invalid or processing fails
+    """
+    return list(process_events(events))
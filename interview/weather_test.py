@@ -1,3 +1,4 @@
+from collections import OrderedDict
 import pytest
 import json
 from . import weather
@@ -17,8 +18,8 @@ def test_process_sample():
     processor.process_sample(sample1)
     
     # Verify data
-    assert processor.stations["Station1"]["high"] == 25.5
-    assert processor.stations["Station1"]["low"] == 25.5
+    assert processor.stations["Station1"].high == 25.5
+    assert processor.stations["Station1"].low == 25.5
     assert processor.last_timestamp == 1000
 
     # Test multiple samples for the same station
@@ -30,8 +31,8 @@ def test_process_sample():
     }
     processor.process_sample(sample2)
     
-    assert processor.stations["Station1"]["high"] == 26.0
-    assert processor.stations["Station1"]["low"] == 25.5
+    assert processor.stations["Station1"].high == 26.0
+    assert processor.stations["Station1"].low == 25.5
     assert processor.last_timestamp == 1001
 
     # Test multiple stations
@@ -43,8 +44,8 @@ def test_process_sample():
     }
     processor.process_sample(sample3)
     
-    assert processor.stations["Station2"]["high"] == 20.0
-    assert processor.stations["Station2"]["low"] == 20.0
+    assert processor.stations["Station2"].high == 20.0
+    assert processor.stations["Station2"].low == 20.0
     assert processor.last_timestamp == 1002
 
     # Test temperature updates
@@ -56,10 +57,54 @@ def test_process_sample():
     }
     processor.process_sample(sample4)
     
-    assert processor.stations["Station2"]["high"] == 20.0
-    assert processor.stations["Station2"]["low"] == 19.0
+    assert processor.stations["Station2"].high == 20.0
+    assert processor.stations["Station2"].low == 19.0
     assert processor.last_timestamp == 1003
 
+def test_process_batch():
+    """Test that batch processing matches per-sample processing"""
+    samples = [
+        {"type": "sample", "stationName": "Station1", "timestamp": 1000, "temperature": 25.5},
+        {"type": "sample", "stationName": "Station2", "timestamp": 1001, "temperature": 20.0},
+        {"type": "sample", "stationName": "Station1", "timestamp": 1002, "temperature": 26.0},
+        {"type": "sample", "stationName": "Station2", "timestamp": 1003, "temperature": 19.0}
+    ]
+
+    batched = weather.WeatherProcessor()
+    batched.process_batch(iter(samples))
+
+    single = weather.WeatherProcessor()
+    for sample in samples:
+        single.process_sample(sample)
+
+    assert batched.get_snapshot() == single.get_snapshot()
+    assert batched.get_global() == single.get_global()
+    assert batched.last_timestamp == 1003
+
+    # Both paths reject invalid samples with the same message
+    invalid_samples = [
+        {"type": "sample", "stationName": "", "timestamp": 1001, "temperature": 20.0},
+        {"type": "sample", "stationName": ["x"], "timestamp": 1001, "temperature": 20.0},
+        {"type": "sample", "stationName": "Station1", "timestamp": 1001, "temperature": "hot"},
+        {"type": "sample", "stationName": "Station1", "timestamp": 1001.5, "temperature": 20.0}
+    ]
+    for sample in invalid_samples:
+        with pytest.raises(ValueError) as single_error:
+            weather.WeatherProcessor().process_sample(sample)
+        with pytest.raises(ValueError) as batch_error:
+            weather.WeatherProcessor().process_batch([sample])
+        assert str(single_error.value) == str(batch_error.value)
+
+    # Samples before an invalid one are kept
+    processor = weather.WeatherProcessor()
+    with pytest.raises(ValueError):
+        processor.process_batch([
+            samples[0],
+            {"type": "sample", "stationName": "", "timestamp": 1001, "temperature": 20.0}
+        ])
+    assert processor.stations["Station1"].high == 25.5
+    assert processor.last_timestamp == 1000
+
 def test_get_snapshot():
     """Test getting data snapshot"""
     processor = weather.WeatherProcessor()
@@ -113,6 +158,65 @@ def test_get_snapshot():
     assert snapshot["stations"]["Station2"]["high"] == 20.0
     assert snapshot["stations"]["Station2"]["low"] == 19.0
 
+def test_get_snapshot_reuse():
+    """Test that unchanged state reuses the previous snapshot"""
+    processor = weather.WeatherProcessor()
+    processor.process_sample(
+        {"type": "sample", "stationName": "Station1", "timestamp": 1000, "temperature": 25.5}
+    )
+    first = processor.get_snapshot()
+    assert processor.get_snapshot() is first
+
+    # A sample within the bounds at the same timestamp changes nothing
+    processor.process_sample(
+        {"type": "sample", "stationName": "Station1", "timestamp": 1000, "temperature": 25.5}
+    )
+    assert processor.get_snapshot() is first
+
+    # A bound change at the same timestamp invalidates the snapshot
+    processor.process_sample(
+        {"type": "sample", "stationName": "Station1", "timestamp": 1000, "temperature": 30.0}
+    )
+    snapshot = json.loads(processor.get_snapshot())
+    assert snapshot["stations"]["Station1"]["high"] == 30.0
+
+    # So does a later timestamp
+    processor.process_batch([
+        {"type": "sample", "stationName": "Station1", "timestamp": 1001, "temperature": 26.0}
+    ])
+    assert json.loads(processor.get_snapshot())["asOf"] == 1001
+
+    # And a reset
+    processor.reset()
+    processor.process_sample(
+        {"type": "sample", "stationName": "Station2", "timestamp": 1001, "temperature": 20.0}
+    )
+    snapshot = json.loads(processor.get_snapshot())
+    assert list(snapshot["stations"]) == ["Station2"]
+
+def test_get_global():
+    """Test high and low temperatures across all stations"""
+    processor = weather.WeatherProcessor()
+    assert processor.get_global() is None
+
+    samples = [
+        {"type": "sample", "stationName": "Station1", "timestamp": 1000, "temperature": 25.5},
+        {"type": "sample", "stationName": "Station2", "timestamp": 1001, "temperature": 20.0},
+        {"type": "sample", "stationName": "Station1", "timestamp": 1002, "temperature": 26.0},
+        {"type": "sample", "stationName": "Station2", "timestamp": 1003, "temperature": 19.0}
+    ]
+    for sample in samples[:2]:
+        processor.process_sample(sample)
+    assert processor.get_global() == (25.5, 20.0)
+
+    processor.process_batch(samples[2:])
+    assert processor.get_global() == (26.0, 19.0)
+
+    processor.reset()
+    assert processor.get_global() is None
+    processor.process_sample(samples[1])
+    assert processor.get_global() == (20.0, 20.0)
+
 def test_reset():
     """Test reset functionality"""
     processor = weather.WeatherProcessor()
@@ -151,8 +255,28 @@ def test_reset():
     # Verify can add data after reset
     processor.process_sample(samples[0])
     assert len(processor.stations) == 1
-    assert processor.stations["Station1"]["high"] == 25.5
-    assert processor.stations["Station1"]["low"] == 25.5
+    assert processor.stations["Station1"].high == 25.5
+    assert processor.stations["Station1"].low == 25.5
+
+def test_reset_reuses_stations():
+    """Test that stations added after a reset start from fresh data"""
+    processor = weather.WeatherProcessor()
+    processor.process_sample(
+        {"type": "sample", "stationName": "Station1", "timestamp": 1000, "temperature": 25.5}
+    )
+    processor.process_sample(
+        {"type": "sample", "stationName": "Station1", "timestamp": 1001, "temperature": 30.0}
+    )
+    for _ in range(3):
+        processor.reset()
+        processor.process_sample(
+            {"type": "sample", "stationName": "Station2", "timestamp": 1002, "temperature": 20.0}
+        )
+        assert list(processor.stations) == ["Station2"]
+        assert processor.stations["Station2"].high == 20.0
+        assert processor.stations["Station2"].low == 20.0
+        snapshot = json.loads(processor.get_snapshot())
+        assert snapshot["stations"] == {"Station2": {"high": 20.0, "low": 20.0}}
 
 def test_process_events():
     """Test event processing flow"""
@@ -233,6 +357,18 @@ def test_process_events():
     assert snapshot3["stations"]["Station3"]["high"] == 30.0
     assert snapshot3["stations"]["Station3"]["low"] == 30.0
 
+def test_run():
+    """Test that run returns the same outputs as process_events"""
+    test_events = [
+        {"type": "sample", "stationName": "Station1", "timestamp": 1000, "temperature": 25.5},
+        {"type": "control", "command": "snapshot"},
+        {"type": "control", "command": "reset"}
+    ]
+    outputs = weather.run(iter(test_events))
+    assert isinstance(outputs, list)
+    assert outputs == list(weather.process_events(test_events))
+    assert len(outputs) == 2
+
 def test_invalid_input():
     """Test invalid input handling"""
     # Test unknown message type
@@ -240,6 +376,56 @@ def test_invalid_input():
         list(weather.process_events([{"type": "unknown"}]))
     assert "Please verify input" in str(exc_info.value)
     
+    # Test events that are not objects
+    for event in ([1, 2], "sample", None, 42):
+        with pytest.raises(ValueError) as exc_info:
+            list(weather.process_events([event]))
+        assert "Event must be an object" in str(exc_info.value)
+
+    # Test dict subclasses are accepted as events
+    outputs = list(weather.process_events([
+        OrderedDict(type="sample", stationName="Station1", timestamp=1000, temperature=25.5),
+        OrderedDict(type="control", command="snapshot")
+    ]))
+    assert json.loads(outputs[0])["stations"]["Station1"]["high"] == 25.5
+
+    # Test missing message type
+    with pytest.raises(ValueError) as exc_info:
+        list(weather.process_events([{"stationName": "Station1"}]))
+    assert "Event must have a type" in str(exc_info.value)
+    with pytest.raises(ValueError) as exc_info:
+        list(weather.process_events([{"type": None}]))
+    assert "Event must have a type" in str(exc_info.value)
+
+    # Test missing command (only when we have sample data)
+    with pytest.raises(ValueError) as exc_info:
+        list(weather.process_events([
+            {
+                "type": "sample",
+                "stationName": "Station1",
+                "timestamp": 1000,
+                "temperature": 25.5
+            },
+            {
+                "type": "control"
+            }
+        ]))
+    assert "Control message must have a command" in str(exc_info.value)
+    with pytest.raises(ValueError) as exc_info:
+        list(weather.process_events([
+            {
+                "type": "sample",
+                "stationName": "Station1",
+                "timestamp": 1000,
+                "temperature": 25.5
+            },
+            {
+                "type": "control",
+                "command": None
+            }
+        ]))
+    assert "Control message must have a command" in str(exc_info.value)
+
     # Test unknown command (only when we have sample data)
     with pytest.raises(ValueError) as exc_info:
         list(weather.process_events([
@@ -285,6 +471,46 @@ def test_invalid_input():
         }]))
     assert "Error processing event" in str(exc_info.value)
 
+    # Test string, float and missing timestamps report the timestamp check
+    for timestamp in ("1000", 1000.5, None):
+        sample = {"type": "sample", "stationName": "Station1", "temperature": 25.5}
+        if timestamp is not None:
+            sample["timestamp"] = timestamp
+        with pytest.raises(ValueError) as exc_info:
+            list(weather.process_events([sample]))
+        assert "Timestamp must be an integer" in str(exc_info.value)
+
+    # Test non-string station name
+    with pytest.raises(ValueError) as exc_info:
+        list(weather.process_events([{
+            "type": "sample",
+            "stationName": 42,
+            "timestamp": 1000,
+            "temperature": 25.5
+        }]))
+    assert "Station name must be a non-empty string" in str(exc_info.value)
+
+    # Test unhashable station names
+    for station_name in (["Station1"], {"name": "Station1"}):
+        with pytest.raises(ValueError) as exc_info:
+            list(weather.process_events([{
+                "type": "sample",
+                "stationName": station_name,
+                "timestamp": 1000,
+                "temperature": 25.5
+            }]))
+        assert "Station name must be a non-empty string" in str(exc_info.value)
+
+    # Test boolean temperature value
+    with pytest.raises(ValueError) as exc_info:
+        list(weather.process_events([{
+            "type": "sample",
+            "stationName": "Station1",
+            "timestamp": 1000,
+            "temperature": True
+        }]))
+    assert "Temperature must be a number" in str(exc_info.value)
+
 def test_control_messages_without_data():
     """Test that control messages are ignored when no sample data is present"""
     # Test at program start